@@ -2,11 +2,16 @@ import requests
 import json
 from azure.identity import DefaultAzureCredential
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 import os
 import sys
 import argparse
 import time
+import functools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 from urllib3.util.retry import Retry
 
 # ANSI color codes for terminal output
@@ -23,24 +28,116 @@ class Colors:
     BRIGHT_GREEN = '\033[92m'
     BRIGHT_BLUE = '\033[94m'
 
+# Colors only on an interactive terminal, and never when NO_COLOR is set (https://no-color.org)
+_USE_COLOR = sys.stdout.isatty() and os.environ.get("NO_COLOR") is None
+
+# Plain output otherwise (redirected to a file or CI log)
+if not _USE_COLOR:
+    for _color_name in [name for name in vars(Colors) if name.isupper()]:
+        setattr(Colors, _color_name, "")
+
+# Pre-VT Windows consoles (outside Windows Terminal) cannot clear the screen with ANSI escapes
+_LEGACY_CONSOLE = os.name == 'nt' and not os.environ.get('WT_SESSION')
+
+# Precomputed prefixes for the per-subscription status lines (plain concatenation in hot loops)
+_OK = f"{Colors.GREEN}  ✅ "
+_SKIP = f"{Colors.YELLOW}  ⏭️  "
+_ERR = f"{Colors.RED}  ❌ "
+_RENEW = f"{Colors.CYAN}  🔄 "
+_PROCESSING = f"\n{Colors.CYAN}🔄 Processing: "
+_RST = Colors.RESET
+
+# Row templates for the subscription listings, rendered into one buffer and written once; names are cut to 60 chars by the format precision
+_ROW = f"{Colors.GREEN}  {{i:3d}}. {{name:.60}} ({{sid}}) - {{state}}{Colors.RESET}\n"
+_EXPIRED_ROW = f"{Colors.RED}❌ [{{count}}] {{name:.60}} - EXPIRED ALERTS!{Colors.RESET}\n"
+_ERROR_ROW = f"{Colors.YELLOW}⚠️  {{name:.60}} - Error: {{status}}{Colors.RESET}\n"
+
 # Global variables for token caching
 _cached_token = None
-_token_expiry = None
+_token_expiry_monotonic = 0.0
 _credential = None
+# Serializes refreshes so concurrent workers share one auth exchange instead of each starting their own
+_token_lock = threading.Lock()
+# Remaining token lifetime (seconds) required before a fan-out starts
+_TOKEN_MIN_REMAINING = 300
+
+# Shared HTTP session (keep-alive + connection pooling across all API calls)
+_session = None
+
+# Interactive mode: background warm-up of subscriptions and existing alerts while the menu is shown.
+# Each future resolves to (monotonic load time, value or None, messages held back for the main thread)
+_subs_future = None
+_alerts_future = None
+# Per-thread list that collects output from background preloads instead of printing it
+_deferred_output = threading.local()
+# Set on exit so queued background work is skipped instead of holding up interpreter shutdown
+_preload_cancel = threading.Event()
 
-# Configure requests session with retry strategy
+# Number of subscriptions scanned concurrently (also sizes the connection pool)
+_SCAN_WORKERS = 15
+# Number of alert creation requests issued concurrently
+_CREATE_WORKERS = 12
+
+# ARM batch endpoint and the number of embedded requests sent per batch
+_BATCH_URL = "https://management.azure.com/batch?api-version=2020-06-01"
+_BATCH_SIZE = 20
+# Times a batch is re-sent for its entries that came back throttled (429)
+_BATCH_THROTTLE_RETRIES = 3
+# How long an asynchronously accepted (202) batch is polled before its entries are reported as errors (seconds)
+_BATCH_POLL_TIMEOUT = 120
+# Longest wait honored from a single Retry-After header (seconds)
+_MAX_RETRY_AFTER = 60
+
+# Warn (at most once a minute) when ARM reports fewer remaining subscription reads than this
+_RATELIMIT_WARN_THRESHOLD = 100
+_ratelimit_warned_at = None
+
+# How long a subscriptions listing is reused across menu actions (seconds)
+_SUBSCRIPTIONS_TTL = 60
+
+# scheduledActions list path, printf-style % (subscription_id, subscription_id). The list API can only
+# $filter on properties/viewId, and anomaly alerts all use the built-in daily anomaly view, so other
+# scheduled actions (cost reports) are dropped server-side; callers still check kind == 'InsightAlert'
+_LIST_PATH_TMPL = (
+    "/subscriptions/%s/providers/Microsoft.CostManagement/scheduledActions?api-version=2022-10-01"
+    "&$filter=properties/viewId%%20eq%%20'/subscriptions/%s/providers/Microsoft.CostManagement/views/ms:DailyAnomalyByResourceGroup'"
+)
+# Single scheduledAction path, printf-style % (subscription_id, alert_name)
+_ALERT_PATH_TMPL = "/subscriptions/%s/providers/Microsoft.CostManagement/scheduledActions/%s?api-version=2022-10-01"
+# Absolute scheduledActions endpoints built from the paths above
+_URL_TMPL = "https://management.azure.com" + _LIST_PATH_TMPL
+_ALERT_URL_TMPL = "https://management.azure.com" + _ALERT_PATH_TMPL
+
+# Pre-serialized InsightAlert body; only emails, dates and subscription id are filled in per request
+_ALERT_TEMPLATE = (
+    '{{"kind":"InsightAlert","properties":{{'
+    '"displayName":"Daily anomaly by resource",'
+    '"notification":{{"to":{emails_json},"subject":"Cost anomaly detected in the resource"}},'
+    '"schedule":{{"frequency":"Daily","startDate":"{start}","endDate":"{end}"}},'
+    '"status":"Enabled",'
+    '"viewId":"/subscriptions/{sub}/providers/Microsoft.CostManagement/views/ms:DailyAnomalyByResourceGroup"'
+    '}}}}'
+)
+
+# Configure requests session with retry strategy (built once and reused)
 def get_requests_session():
-    session = requests.Session()
-    retry_strategy = Retry(
-        total=3,
-        backoff_factor=1,
-        status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE"]
-    )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
-    return session
+    global _session
+    if _session is None:
+        session = requests.Session()
+        retry_strategy = Retry(
+            total=3,
+            backoff_factor=0.3,
+            backoff_jitter=0.5,  # Spread out retries when many workers are throttled at once
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(["HEAD", "GET", "PUT", "POST", "DELETE", "OPTIONS", "TRACE"]),
+            respect_retry_after_header=True
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=_SCAN_WORKERS, max_retries=retry_strategy)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({"Content-Type": "application/json"})
+        _session = session
+    return _session
 
 # ASCII Art and visual enhancements
 def print_header():
@@ -65,7 +162,7 @@ def print_success_box(message):
 """)
 
 def print_error_box(message):
-    print(f"""
+    _notify(f"""
 {Colors.RED}❌ {message}{Colors.RESET}
 """)
 
@@ -87,100 +184,179 @@ def print_section_header(title):
 {'='*80}
 {Colors.RESET}""")
 
-def print_loading_animation():
-    frames = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-    for i in range(20):
-        print(f"\r{Colors.CYAN}🔄 Loading {frames[i % len(frames)]} Connecting to Azure...{Colors.RESET}", end='', flush=True)
-        time.sleep(0.1)
-    print(f"\r{Colors.GREEN}✅ Connected to Azure successfully!{Colors.RESET}")
+# Print a message, or hold it for the main thread when running inside a background preload
+def _notify(message, file=None):
+    messages = getattr(_deferred_output, 'messages', None)
+    if messages is None:
+        print(message, file=file)
+    else:
+        messages.append((message, file))
 
 # Initialize Azure connection (called once at startup)
 def initialize_azure_connection():
     global _credential
-    print_loading_animation()
+    print(f"{Colors.CYAN}🔄 Connecting to Azure...{Colors.RESET}", end='', flush=True)
     try:
         _credential = DefaultAzureCredential()
-        # Test the connection by getting a token
-        _credential.get_token("https://management.azure.com/.default")
+        # Test the connection with a single token request (no retries, one error box) and prime the token cache
+        with _token_lock:
+            _store_token(_credential.get_token("https://management.azure.com/.default"))
+        print(f"\r{Colors.GREEN}✅ Connected to Azure successfully!{Colors.RESET}")
         print_info_box("Azure connection initialized and verified")
     except Exception as e:
         print_error_box(f"Failed to initialize Azure connection: {str(e)}")
         sys.exit(1)
 
 # Get access token with caching and error handling
-def get_access_token():
-    global _cached_token, _token_expiry, _credential
+def get_access_token(min_remaining=0):
+    global _credential
     
-    # Check if we have a valid cached token
-    if _cached_token and _token_expiry and datetime.now(timezone.utc) < _token_expiry:
+    # Check if we have a valid cached token (monotonic clock: cheap and immune to wall-clock changes)
+    if _cached_token and time.monotonic() + min_remaining < _token_expiry_monotonic:
         return _cached_token
     
-    # Get new token with retry logic
-    max_retries = 3
-    for attempt in range(max_retries):
-        try:
-            if _credential is None:
-                _credential = DefaultAzureCredential()
-            
-            token_response = _credential.get_token("https://management.azure.com/.default")
-            _cached_token = token_response.token
-            # Set expiry time to 50 minutes from now (tokens usually last 1 hour)
-            _token_expiry = datetime.now(timezone.utc) + timedelta(minutes=50)
-            
+    with _token_lock:
+        # Another thread may have refreshed while this one waited for the lock
+        if _cached_token and time.monotonic() + min_remaining < _token_expiry_monotonic:
             return _cached_token
-            
-        except Exception as e:
-            if attempt < max_retries - 1:
-                print(f"{Colors.YELLOW}⚠️  Token refresh attempt {attempt + 1} failed, retrying...{Colors.RESET}")
-                time.sleep(2 ** attempt)  # Exponential backoff
-            else:
-                print_error_box(f"Failed to get access token after {max_retries} attempts: {str(e)}")
-                raise
+        
+        # Get new token with retry logic
+        max_retries = 3
+        for attempt in range(max_retries):
+            try:
+                if _credential is None:
+                    _credential = DefaultAzureCredential()
+                
+                return _store_token(_credential.get_token("https://management.azure.com/.default"))
+                
+            except Exception as e:
+                if attempt < max_retries - 1:
+                    _notify(f"{Colors.YELLOW}⚠️  Token refresh attempt {attempt + 1} failed, retrying...{Colors.RESET}")
+                    time.sleep(2 ** attempt)  # Exponential backoff
+                else:
+                    print_error_box(f"Failed to get access token after {max_retries} attempts: {str(e)}")
+                    raise
+
+# Cache a token response (caller holds _token_lock) and return the token
+def _store_token(token_response):
+    global _cached_token, _token_expiry_monotonic, _credential
+    _cached_token = token_response.token
+    # Pin the credential that succeeded so later refreshes skip the DefaultAzureCredential probe chain
+    _credential = getattr(_credential, '_successful_credential', None) or _credential
+    # Refresh 60 seconds before the token's own expiry (expires_on is epoch seconds)
+    _token_expiry_monotonic = time.monotonic() + (token_response.expires_on - time.time()) - 60
+    return _cached_token
+
+# Refresh ahead of time so a fan-out never hits token expiry part-way through
+def _ensure_token_valid(min_remaining=_TOKEN_MIN_REMAINING):
+    return get_access_token(min_remaining)
+
+# Drop the cached token if it is still the one that was rejected, so the next get_access_token() fetches a fresh one
+def _invalidate_access_token(rejected_token):
+    global _cached_token, _token_expiry_monotonic
+    with _token_lock:
+        if _cached_token == rejected_token:
+            _cached_token = None
+            _token_expiry_monotonic = 0.0
 
-# Enhanced function to make Azure API calls with retry logic
+# Request headers carrying the given bearer token plus any caller-supplied headers
+def _auth_headers(token, headers=None):
+    request_headers = {"Authorization": f"Bearer {token}"}
+    if headers:
+        request_headers.update(headers)
+    return request_headers
+
+# Function to make Azure API calls over the shared session
 def make_azure_api_call(url, method="GET", headers=None, data=None, timeout=30):
-    """Make Azure API call with retry logic and error handling"""
-    session = get_requests_session()
+    """Make Azure API call; connection errors, timeouts and 429/5xx are retried by the session's Retry"""
+    # The bearer header is sent per request, so a 401 always identifies the exact token that was rejected
+    token = get_access_token()
+    response = get_requests_session().request(method, url, headers=_auth_headers(token, headers), data=data, timeout=timeout)
+    
+    # Token revoked or expired early: refresh once and replay the request (concurrent 401s share one refresh)
+    if response.status_code == 401:
+        _invalidate_access_token(token)
+        token = get_access_token()
+        response = get_requests_session().request(method, url, headers=_auth_headers(token, headers), data=data, timeout=timeout)
+    
+    return response
+
+# Report on stderr when the subscription's ARM read quota is running low (headers from a response or a batch entry)
+def _warn_if_throttling(headers):
+    global _ratelimit_warned_at
+    remaining = headers.get('x-ms-ratelimit-remaining-subscription-reads')
+    
+    if remaining is None or int(remaining) >= _RATELIMIT_WARN_THRESHOLD:
+        return
     
-    max_retries = 3
-    for attempt in range(max_retries):
+    now = time.monotonic()
+    if _ratelimit_warned_at is None or now - _ratelimit_warned_at >= 60:
+        _ratelimit_warned_at = now
+        _notify(f"{Colors.YELLOW}⚠️  ARM read quota low: {remaining} subscription reads remaining{Colors.RESET}", file=sys.stderr)
+
+# Seconds to wait from a Retry-After header (delta-seconds or HTTP-date); default when missing or malformed
+def _retry_after_seconds(headers, default=1):
+    value = headers.get('Retry-After')
+    if value is None:
+        return default
+    
+    try:
+        seconds = float(value)
+    except ValueError:
         try:
-            if method.upper() == "GET":
-                response = session.get(url, headers=headers, timeout=timeout)
-            elif method.upper() == "PUT":
-                response = session.put(url, headers=headers, data=data, timeout=timeout)
-            else:
-                response = session.request(method, url, headers=headers, data=data, timeout=timeout)
-            
-            return response
+            seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return default
+    
+    return min(max(seconds, 0), _MAX_RETRY_AFTER)
+
+# GET an ARM resource; 429/5xx are retried by the session honoring Retry-After
+def _arm_get(url, timeout=30):
+    response = make_azure_api_call(url, timeout=timeout)
+    _warn_if_throttling(response.headers)
+    return response
+
+# Memoize non-empty results per argument set for ttl seconds; exposes cache_clear() like functools.lru_cache
+def _ttl_cache(ttl):
+    def decorator(func):
+        cache = {}
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            entry = cache.get(key)
+            if entry and time.monotonic() < entry[0]:
+                return list(entry[1])
             
-        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout, 
-                requests.exceptions.ReadTimeout) as e:
-            if attempt < max_retries - 1:
-                wait_time = 2 ** attempt
-                print(f"{Colors.YELLOW}⚠️  Connection error on attempt {attempt + 1}, retrying in {wait_time}s...{Colors.RESET}")
-                time.sleep(wait_time)
-            else:
-                raise e
-        except Exception as e:
-            print_error_box(f"Unexpected error in API call: {str(e)}")
-            raise e
+            result = func(*args, **kwargs)
+            # Failures come back as [] and are not cached, so the next call retries
+            if result:
+                cache[key] = (time.monotonic() + ttl, result)
+            return list(result)
+        
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
 
 # Function to get subscriptions from Azure with status filtering
+@_ttl_cache(_SUBSCRIPTIONS_TTL)
 def get_subscriptions(include_inactive=False):
+    # Interactive mode: use the background listing when it is still fresh
+    if not include_inactive:
+        preloaded = _preloaded_value(_subs_future)
+        if preloaded is not None:
+            return preloaded
+    
+    return _list_subscriptions(include_inactive)
+
+# List subscriptions straight from ARM (uncached); failures are reported and return []
+def _list_subscriptions(include_inactive=False):
     try:
-        access_token = get_access_token()
         url = "https://management.azure.com/subscriptions?api-version=2022-12-01"
-        
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json"
-        }
-        
-        response = make_azure_api_call(url, headers=headers)
+        response = _arm_get(url)
         
         if response.status_code == 200:
-            data = response.json()
+            data = json.loads(response.content)
             subscriptions = []
             
             for sub in data['value']:
@@ -196,75 +372,243 @@ def get_subscriptions(include_inactive=False):
             
             return subscriptions
         else:
-            print(f"{Colors.RED}Failed to get subscriptions. Status code: {response.status_code}{Colors.RESET}")
+            _notify(f"{Colors.RED}Failed to get subscriptions. Status code: {response.status_code}{Colors.RESET}")
             return []
             
     except Exception as e:
         print_error_box(f"Error getting subscriptions: {str(e)}")
         return []
 
-# Function to check if subscription is active
-def is_subscription_active(subscription_id):
+# Flatten subscriptions into (id, name, state) rows for the listing loops
+def _subscription_rows(subscriptions):
+    """Return [(subscription_id, name, state), ...] in listing order"""
+    return [(subscription['id'], subscription['name'], subscription['state']) for subscription in subscriptions]
+
+# Alert validity window as ISO strings - changed from 365 days to 5 years (1825 days)
+def _alert_schedule_window():
+    start_date = datetime.now(timezone.utc).replace(microsecond=0)
+    end_date = start_date + timedelta(days=1825)  # 5 years = 365 * 5 = 1825 days
+    return start_date.isoformat(), end_date.isoformat()
+
+# Build the PUT body for one subscription's alert from the pre-serialized template
+def _make_alert_body(subscription_id, emails_json, start_iso, end_iso):
+    """Return the UTF-8 encoded InsightAlert body; emails_json is the JSON-encoded recipient list"""
+    return _ALERT_TEMPLATE.format(emails_json=emails_json, start=start_iso, end=end_iso, sub=subscription_id).encode('utf-8')
+
+# Function to create cost anomaly alert
+def create_cost_anomaly_alert(subscription_id, alert_name, emails):
+    url = _ALERT_URL_TMPL % (subscription_id, alert_name)
+    
+    start_iso, end_iso = _alert_schedule_window()
+    payload = _make_alert_body(subscription_id, json.dumps(emails), start_iso, end_iso)
+
+    response = make_azure_api_call(url, method="PUT", data=payload)
+    
+    if response.status_code == 201 or response.status_code == 200:
+        print(f"{Colors.GREEN}Alert successfully created for subscription {subscription_id}{Colors.RESET}")
+    else:
+        print(f"{Colors.RED}Failed to create alert for subscription {subscription_id}. Status code: {response.status_code}, Response: {response.text}{Colors.RESET}")
+
+# Run an I/O-bound task for every item on a bounded thread pool sharing the pooled session
+def _run_concurrently(task, items, max_workers, *args):
+    """Yield task(item, *args) results in input order; results are consumed on the calling thread"""
+    _ensure_token_valid()
+    # Workers inherit the caller's deferred output, so a background preload stays quiet end to end
+    messages = getattr(_deferred_output, 'messages', None)
+    
+    def run(item):
+        if messages is not None and _preload_cancel.is_set():
+            raise RuntimeError("Background refresh cancelled")
+        _deferred_output.messages = messages
+        return task(item, *args)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(run, items)
+
+# Sleep before a retry; a background preload wakes up early and stops once exit is requested
+def _backoff(seconds):
+    if getattr(_deferred_output, 'messages', None) is None:
+        time.sleep(seconds)
+    elif _preload_cancel.wait(seconds):
+        raise RuntimeError("Background refresh cancelled")
+
+# Parse an ISO-8601 end date to epoch seconds; cached because alerts tend to share end dates
+@functools.lru_cache(maxsize=4096)
+def _end_date_timestamp(end_date_str):
+    """Return the POSIX timestamp of an ISO-8601 string, accepting a trailing 'Z'"""
+    if end_date_str.endswith('Z'):
+        end_date_str = f"{end_date_str[:-1]}+00:00"
+    return datetime.fromisoformat(end_date_str).timestamp()
+
+# Classify a subscription's scheduled actions by the state of its anomaly alerts
+def _classify_scheduled_actions(scheduled_actions, current_ts):
+    """Return (category, alert_count) with category 'none', 'valid' or 'expired'"""
+    anomaly_alerts = [alert for alert in scheduled_actions if alert.get('kind') == 'InsightAlert']
+    
+    if not anomaly_alerts:
+        return 'none', None
+    
+    # An alert is valid while at least one full day remains before its end date
+    cutoff_ts = current_ts + 86400
+    
+    for alert in anomaly_alerts:
+        end_date_str = alert.get('properties', {}).get('schedule', {}).get('endDate')
+        
+        if not end_date_str:
+            # No end date, treat as expired
+            continue
+        
+        try:
+            end_ts = _end_date_timestamp(end_date_str)
+        except ValueError:
+            # Invalid date format, treat as expired
+            continue
+        
+        if end_ts >= cutoff_ts:
+            # One valid alert is enough to skip the subscription
+            return 'valid', len(anomaly_alerts)
+    
+    return 'expired', len(anomaly_alerts)
+
+# Scan a single subscription for Cost Management anomaly alerts (runs on worker threads)
+def _scan_subscription(subscription, current_ts):
+    """Return (subscription, category, detail) with category 'none', 'valid', 'expired', 'error' or 'exception'"""
     try:
-        access_token = get_access_token()
-        url = f"https://management.azure.com/subscriptions/{subscription_id}?api-version=2022-12-01"
+        url = _URL_TMPL % (subscription['id'], subscription['id'])
+        response = _arm_get(url)
+        
+        if response.status_code != 200:
+            return subscription, 'error', response.status_code
         
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json"
+        # Parse straight from the raw bytes; skips requests' text decoding step
+        category, detail = _classify_scheduled_actions(json.loads(response.content).get('value', []), current_ts)
+        return subscription, category, detail
+        
+    except Exception as e:
+        return subscription, 'exception', str(e)
+
+# Fetch scheduled actions for several subscriptions in one ARM /batch round trip
+def _batch_get_scheduled_actions(subscription_ids):
+    """Return {subscription_id: (status_code, content)} where content is the scheduledActions list response"""
+    results = {}
+    pending = list(subscription_ids)
+    
+    # Throttled entries come back as 429 inside a 200 batch, out of the session Retry's reach; re-send only those
+    for attempt in range(_BATCH_THROTTLE_RETRIES + 1):
+        batch_body = {
+            "requests": [
+                {
+                    "httpMethod": "GET",
+                    "name": str(index),
+                    "url": _LIST_PATH_TMPL % (subscription_id, subscription_id)
+                }
+                for index, subscription_id in enumerate(pending)
+            ]
         }
         
-        response = make_azure_api_call(url, headers=headers)
+        response = make_azure_api_call(_BATCH_URL, method="POST", data=json.dumps(batch_body).encode('utf-8'))
         
-        if response.status_code == 200:
-            data = response.json()
-            return data.get('state') == 'Enabled'
-        else:
-            print(f"{Colors.RED}Error checking subscription {subscription_id} status: {response.status_code}{Colors.RESET}")
-            return False
+        # ARM may accept the batch for asynchronous processing; poll until the results are ready or the deadline passes
+        poll_deadline = time.monotonic() + _BATCH_POLL_TIMEOUT
+        while response.status_code == 202:
+            location = response.headers.get('Location')
+            if not location or time.monotonic() >= poll_deadline:
+                # Still pending: the entries are reported with the 202 status below
+                break
+            _backoff(_retry_after_seconds(response.headers))
+            response = _arm_get(location)
+        
+        if response.status_code != 200:
+            results.update((subscription_id, (response.status_code, None)) for subscription_id in pending)
+            return results
+        
+        throttled = []
+        retry_after = 1
+        for item in json.loads(response.content).get('responses', []):
+            subscription_id = pending[int(item['name'])]
+            item_headers = CaseInsensitiveDict(item.get('headers') or {})
+            _warn_if_throttling(item_headers)
             
+            if item.get('httpStatusCode') == 429 and attempt < _BATCH_THROTTLE_RETRIES:
+                throttled.append(subscription_id)
+                retry_after = max(retry_after, _retry_after_seconds(item_headers))
+            else:
+                results[subscription_id] = (item.get('httpStatusCode'), item.get('content'))
+        
+        if not throttled:
+            break
+        
+        _backoff(retry_after)
+        pending = throttled
+    
+    return results
+
+# Fetch one chunk through ARM /batch (runs on worker threads); a failed chunk is reported once and leaves its subscriptions without a status
+def _batch_get_chunk(subscription_ids):
+    try:
+        return _batch_get_scheduled_actions(subscription_ids)
     except Exception as e:
-        print(f"{Colors.RED}Exception checking subscription {subscription_id}: {str(e)}{Colors.RESET}")
-        return False
+        print_error_box(f"Error fetching scheduled actions for {len(subscription_ids)} subscriptions: {str(e)}")
+        return {subscription_id: (None, None) for subscription_id in subscription_ids}
 
-# Function to create cost anomaly alert
-def create_cost_anomaly_alert(subscription_id, alert_name, emails):
-    access_token = get_access_token()
-    url = f"https://management.azure.com/subscriptions/{subscription_id}/providers/Microsoft.CostManagement/scheduledActions/{alert_name}?api-version=2022-10-01"
+# Fetch the scheduled actions of many subscriptions through ARM /batch, several batches concurrently
+def batch_scheduled_actions(subscription_ids):
+    """Return {subscription_id: (status_code, scheduled_actions)}; scheduled_actions is None unless status_code is 200"""
+    chunks = [subscription_ids[i:i + _BATCH_SIZE] for i in range(0, len(subscription_ids), _BATCH_SIZE)]
+    results = {}
     
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Content-Type": "application/json"
-    }
+    for chunk_results in _run_concurrently(_batch_get_chunk, chunks, _SCAN_WORKERS):
+        for subscription_id, (status_code, content) in chunk_results.items():
+            scheduled_actions = (content or {}).get('value', []) if status_code == 200 else None
+            results[subscription_id] = (status_code, scheduled_actions)
     
-    # Set dates - changed from 365 days to 5 years (1825 days)
-    start_date = datetime.now(timezone.utc).replace(microsecond=0)
-    end_date = (start_date + timedelta(days=1825)).replace(microsecond=0)  # 5 years = 365 * 5 = 1825 days
-    
-    alert_body = {
-        "kind": "InsightAlert",
-        "properties": {
-            "displayName": "Daily anomaly by resource",
-            "notification": {
-                "to": emails,
-                "subject": "Cost anomaly detected in the resource"
-            },
-            "schedule": {
-                "frequency": "Daily",
-                "startDate": start_date.isoformat(),
-                "endDate": end_date.isoformat()
-            },
-            "status": "Enabled",
-            "viewId": f"/subscriptions/{subscription_id}/providers/Microsoft.CostManagement/views/ms:DailyAnomalyByResourceGroup"
-        }
+    return results
+
+# Existing Cost Management anomaly alerts for many subscriptions, keyed by subscription id
+def fetch_insight_alerts(subscription_ids):
+    """Return {subscription_id: (status_code, insight_alerts)}; insight_alerts is None unless status_code is 200"""
+    return {
+        subscription_id: (status_code, None if scheduled_actions is None else [alert for alert in scheduled_actions if alert.get('kind') == 'InsightAlert'])
+        for subscription_id, (status_code, scheduled_actions) in batch_scheduled_actions(subscription_ids).items()
     }
 
-    response = requests.put(url, headers=headers, data=json.dumps(alert_body))
+# Scan a chunk of subscriptions for anomaly alerts through a single batch request (runs on worker threads)
+def _scan_subscription_batch(subscriptions, current_ts):
+    """Return a list of (subscription, category, detail) tuples, as produced by _scan_subscription"""
+    try:
+        responses = _batch_get_scheduled_actions([subscription['id'] for subscription in subscriptions])
+    except Exception as e:
+        return [(subscription, 'exception', str(e)) for subscription in subscriptions]
     
-    if response.status_code == 201 or response.status_code == 200:
-        print(f"{Colors.GREEN}Alert successfully created for subscription {subscription_id}{Colors.RESET}")
-    else:
-        print(f"{Colors.RED}Failed to create alert for subscription {subscription_id}. Status code: {response.status_code}, Response: {response.text}{Colors.RESET}")
+    results = []
+    for subscription in subscriptions:
+        status_code, content = responses.get(subscription['id'], (None, None))
+        
+        if status_code != 200:
+            results.append((subscription, 'error', status_code))
+        else:
+            # Any valid anomaly alert counts, whatever its name, so no duplicate is created next to it
+            category, detail = _classify_scheduled_actions((content or {}).get('value', []), current_ts)
+            results.append((subscription, category, detail))
+    
+    return results
+
+# PUT a single alert definition (runs on worker threads)
+def _put_alert(subscription, alert_name, emails_json, start_iso, end_iso):
+    """Return (subscription, status_code, error) for one alert creation request"""
+    try:
+        url = _ALERT_URL_TMPL % (subscription['id'], alert_name)
+        payload = _make_alert_body(subscription['id'], emails_json, start_iso, end_iso)
+        response = make_azure_api_call(url, method="PUT", data=payload)
+        return subscription, response.status_code, None
+    except Exception as e:
+        return subscription, None, str(e)
+
+# PUT the alert on every subscription concurrently
+def _put_alerts(subscriptions, alert_name, emails):
+    """Yield (subscription, status_code, error) in input order; the shared parts of the body are serialized once"""
+    start_iso, end_iso = _alert_schedule_window()
+    return _run_concurrently(_put_alert, subscriptions, _CREATE_WORKERS, alert_name, json.dumps(emails), start_iso, end_iso)
 
 # Function to create alerts for all subscriptions (updated)
 def create_alerts_for_all_subscriptions(alert_name=None, emails=None, auto_mode=False):
@@ -296,84 +640,36 @@ def create_alerts_for_all_subscriptions(alert_name=None, emails=None, auto_mode=
         print_section_header("SCANNING FOR EXISTING ALERTS")
         print(f"{Colors.CYAN}🔍 Scanning {len(subscriptions)} active subscriptions...\n{Colors.RESET}")
         
-        access_token = get_access_token()
-        current_date = datetime.now(timezone.utc)
+        current_ts = time.time()
         subscriptions_without_alerts = []
         subscriptions_with_valid_alerts = []
         subscriptions_with_expired_alerts = []
         subscription_errors = []
         
-        # Process subscriptions in smaller batches to avoid overwhelming the API
-        batch_size = 10
-        for i in range(0, len(subscriptions), batch_size):
-            batch = subscriptions[i:i + batch_size]
-            
-            for subscription in batch:
-                try:
-                    if not is_subscription_active(subscription['id']):
-                        print(f"{Colors.RED}  ❌ {subscription['name'][:60]} - Inactive subscription{Colors.RESET}")
-                        subscription_errors.append(subscription)
-                        continue
-                    
-                    url = f"https://management.azure.com/subscriptions/{subscription['id']}/providers/Microsoft.CostManagement/scheduledActions?api-version=2022-10-01"
-                    
-                    headers = {
-                        "Authorization": f"Bearer {access_token}",
-                        "Content-Type": "application/json"
-                    }
-                    
-                    response = make_azure_api_call(url, headers=headers)
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        anomaly_alerts = [alert for alert in data.get('value', []) if alert.get('kind') == 'InsightAlert']
-                        
-                        if not anomaly_alerts:
-                            # No alerts at all
-                            subscriptions_without_alerts.append(subscription)
-                            print(f"{Colors.GREEN}  ✅ {subscription['name'][:60]} - No alerts, ready for creation{Colors.RESET}")
-                        else:
-                            # Check if any alerts are still valid (not expired)
-                            has_valid_alerts = False
-                            expired_count = 0
-                            
-                            for alert in anomaly_alerts:
-                                end_date_str = alert.get('properties', {}).get('schedule', {}).get('endDate')
-                                
-                                if end_date_str:
-                                    try:
-                                        end_date = datetime.fromisoformat(end_date_str.replace('Z', '+00:00'))
-                                        days_remaining = (end_date - current_date).days
-                                        
-                                        if days_remaining > 0:
-                                            has_valid_alerts = True
-                                        else:
-                                            expired_count += 1
-                                    except ValueError:
-                                        # Invalid date format, treat as expired
-                                        expired_count += 1
-                                else:
-                                    # No end date, treat as expired
-                                    expired_count += 1
-                            
-                            if has_valid_alerts:
-                                subscriptions_with_valid_alerts.append(subscription)
-                                print(f"{Colors.YELLOW}  ⏭️  {subscription['name'][:60]} - Has valid alerts ({len(anomaly_alerts)} total, {expired_count} expired){Colors.RESET}")
-                            else:
-                                # All alerts are expired, needs new alert
-                                subscriptions_with_expired_alerts.append(subscription)
-                                print(f"{Colors.CYAN}  🔄 {subscription['name'][:60]} - All alerts expired ({expired_count} total), ready for new alert{Colors.RESET}")
-                    else:
-                        print(f"{Colors.RED}  ❌ {subscription['name'][:60]} - Error: {response.status_code}{Colors.RESET}")
-                        subscription_errors.append(subscription)
-                        
-                except Exception as e:
-                    print(f"{Colors.RED}  ❌ {subscription['name'][:60]} - Exception: {str(e)}{Colors.RESET}")
+        # Scan in ARM /batch chunks, several chunks concurrently; results are printed from this thread
+        chunks = [subscriptions[i:i + _BATCH_SIZE] for i in range(0, len(subscriptions), _BATCH_SIZE)]
+        for results in _run_concurrently(_scan_subscription_batch, chunks, _SCAN_WORKERS, current_ts):
+            # One write per batch instead of one print per subscription
+            lines = []
+            for subscription, category, detail in results:
+                if category == 'none':
+                    # No alerts at all
+                    subscriptions_without_alerts.append(subscription)
+                    lines.append(_OK + subscription['name'][:60] + " - No alerts, ready for creation" + _RST)
+                elif category == 'valid':
+                    subscriptions_with_valid_alerts.append(subscription)
+                    lines.append(_SKIP + subscription['name'][:60] + " - Has valid alerts (" + str(detail) + " total)" + _RST)
+                elif category == 'expired':
+                    # All alerts are expired, needs new alert
+                    subscriptions_with_expired_alerts.append(subscription)
+                    lines.append(_RENEW + subscription['name'][:60] + " - All alerts expired (" + str(detail) + " total), ready for new alert" + _RST)
+                elif category == 'error':
+                    lines.append(_ERR + subscription['name'][:60] + " - Error: " + str(detail) + _RST)
                     subscription_errors.append(subscription)
-            
-            # Small delay between batches to prevent overwhelming the API
-            if i + batch_size < len(subscriptions):
-                time.sleep(1)
+                else:
+                    lines.append(_ERR + subscription['name'][:60] + " - Exception: " + str(detail) + _RST)
+                    subscription_errors.append(subscription)
+            sys.stdout.write("\n".join(lines) + "\n")
         
         # Combine subscriptions that need alerts (no alerts + expired alerts)
         subscriptions_needing_alerts = subscriptions_without_alerts + subscriptions_with_expired_alerts
@@ -411,61 +707,22 @@ def create_alerts_for_all_subscriptions(alert_name=None, emails=None, auto_mode=
         successful_creates = 0
         failed_creates = 0
         
-        for subscription in subscriptions_needing_alerts:
-            try:
-                print(f"\n{Colors.CYAN}🔄 Processing: {subscription['name']}{Colors.RESET}")
-                
-                if not is_subscription_active(subscription['id']):
-                    print(f"{Colors.RED}  ❌ Subscription became inactive{Colors.RESET}")
-                    failed_creates += 1
-                    continue
-                
-                access_token = get_access_token()
-                url = f"https://management.azure.com/subscriptions/{subscription['id']}/providers/Microsoft.CostManagement/scheduledActions/{alert_name}?api-version=2022-10-01"
-                
-                headers = {
-                    "Authorization": f"Bearer {access_token}",
-                    "Content-Type": "application/json"
-                }
-                
-                start_date = datetime.now(timezone.utc).replace(microsecond=0)
-                end_date = (start_date + timedelta(days=1825)).replace(microsecond=0)  # 5 years = 365 * 5 = 1825 days
-                
-                alert_body = {
-                    "kind": "InsightAlert",
-                    "properties": {
-                        "displayName": "Daily anomaly by resource",
-                        "notification": {
-                            "to": emails,
-                            "subject": "Cost anomaly detected in the resource"
-                        },
-                        "schedule": {
-                            "frequency": "Daily",
-                            "startDate": start_date.isoformat(),
-                            "endDate": end_date.isoformat()
-                        },
-                        "status": "Enabled",
-                        "viewId": f"/subscriptions/{subscription['id']}/providers/Microsoft.CostManagement/views/ms:DailyAnomalyByResourceGroup"
-                    }
-                }
-
-                response = make_azure_api_call(url, method="PUT", headers=headers, data=json.dumps(alert_body))
-                
-                if response.status_code == 201 or response.status_code == 200:
-                    is_replacement = subscription in subscriptions_with_expired_alerts
-                    action_text = "replaced expired alert" if is_replacement else "created new alert"
-                    print(f"{Colors.GREEN}  ✅ Successfully {action_text}{Colors.RESET}")
-                    successful_creates += 1
-                else:
-                    print(f"{Colors.RED}  ❌ Failed to create alert (Status: {response.status_code}){Colors.RESET}")
-                    failed_creates += 1
-                    
-            except Exception as e:
-                print(f"{Colors.RED}  ❌ Exception creating alert: {str(e)}{Colors.RESET}")
+        # Report each result as it arrives so long runs show progress
+        for subscription, status_code, error in _put_alerts(subscriptions_needing_alerts, alert_name, emails):
+            if error is not None:
+                result_line = _ERR + "Exception creating alert: " + error + _RST
+                failed_creates += 1
+            elif status_code == 201 or status_code == 200:
+                is_replacement = subscription in subscriptions_with_expired_alerts
+                action_text = "replaced expired alert" if is_replacement else "created new alert"
+                result_line = _OK + "Successfully " + action_text + _RST
+                successful_creates += 1
+            else:
+                result_line = _ERR + "Failed to create alert (Status: " + str(status_code) + ")" + _RST
                 failed_creates += 1
             
-            # Small delay between alert creations
-            time.sleep(0.5)
+            sys.stdout.write(_PROCESSING + subscription['name'] + _RST + "\n" + result_line + "\n")
+            sys.stdout.flush()
         
         print(f"""
 {Colors.CYAN}🎉 FINAL RESULTS:{Colors.RESET}
@@ -492,7 +749,7 @@ def create_alert_for_selected_subscriptions():
     
     print_section_header("SELECT SUBSCRIPTIONS (ACTIVE ONLY)")
     for i, sub in enumerate(subscriptions, 1):
-        print(f"{Colors.WHITE}  {i:2d}. {sub['name'][:60]} ({sub['id']}) - {sub['state']}{Colors.RESET}")
+        print(f"{Colors.WHITE}  {i:2d}. {sub['name']:.60} ({sub['id']}) - {sub['state']}{Colors.RESET}")
     
     print(f"\n{Colors.CYAN}💡 Enter subscription numbers separated by commas (e.g., 1,3,5) or 'all' for all active subscriptions{Colors.RESET}")
     choice_input = input(f"{Colors.YELLOW}🎯 Selection: {Colors.RESET}").strip()
@@ -519,46 +776,33 @@ def create_alert_for_selected_subscriptions():
     
     print_section_header("SELECTED SUBSCRIPTIONS")
     for sub in selected_subscriptions:
-        print(f"{Colors.GREEN}  • {sub['name'][:60]} ({sub['id']}) - {sub['state']}{Colors.RESET}")
+        print(f"{Colors.GREEN}  • {sub['name']:.60} ({sub['id']}) - {sub['state']}{Colors.RESET}")
     
     # Check if alerts already exist for selected subscriptions
     print_section_header("CHECKING EXISTING ALERTS")
     print(f"{Colors.CYAN}🔍 Checking {len(selected_subscriptions)} selected subscriptions for existing alerts...\n{Colors.RESET}")
     
-    access_token = get_access_token()
     subscriptions_without_alerts = []
     subscriptions_with_alerts = []
     subscription_errors = []
     
-    for subscription in selected_subscriptions:
-        # Double-check subscription status before processing
-        if not is_subscription_active(subscription['id']):
-            print(f"{Colors.RED}  ❌ {subscription['name'][:60]} - Subscription is not active, skipping{Colors.RESET}")
+    current_ts = time.time()
+    lines = []
+    for subscription, category, detail in _run_concurrently(_scan_subscription, selected_subscriptions, _SCAN_WORKERS, current_ts):
+        if category in ('valid', 'expired'):
+            subscriptions_with_alerts.append(subscription)
+            lines.append(_SKIP + subscription['name'][:60] + " - Already has " + str(detail) + " alert(s)" + _RST)
+        elif category == 'none':
+            subscriptions_without_alerts.append(subscription)
+            lines.append(_OK + subscription['name'][:60] + " - No existing alerts" + _RST)
+        elif category == 'error':
+            lines.append(_ERR + subscription['name'][:60] + " - Status: " + str(detail) + _RST)
             subscription_errors.append(subscription)
-            continue
-            
-        url = f"https://management.azure.com/subscriptions/{subscription['id']}/providers/Microsoft.CostManagement/scheduledActions?api-version=2022-10-01"
-        
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json"
-        }
-        
-        response = requests.get(url, headers=headers)
-        
-        if response.status_code == 200:
-            data = response.json()
-            anomaly_alerts = [alert for alert in data.get('value', []) if alert.get('kind') == 'InsightAlert']
-            
-            if anomaly_alerts:
-                subscriptions_with_alerts.append(subscription)
-                print(f"{Colors.YELLOW}  ⏭️  {subscription['name'][:60]} - Already has {len(anomaly_alerts)} alert(s){Colors.RESET}")
-            else:
-                subscriptions_without_alerts.append(subscription)
-                print(f"{Colors.GREEN}  ✅ {subscription['name'][:60]} - No existing alerts{Colors.RESET}")
         else:
-            print(f"{Colors.RED}  ❌ {subscription['name'][:60]} - Status: {response.status_code}{Colors.RESET}")
+            lines.append(_ERR + subscription['name'][:60] + " - Exception: " + str(detail) + _RST)
             subscription_errors.append(subscription)
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
     
     print(f"""
 {Colors.CYAN}📊 SUMMARY:{Colors.RESET}
@@ -597,54 +841,19 @@ def create_alert_for_selected_subscriptions():
     successful_creates = 0
     failed_creates = 0
     
-    for subscription in subscriptions_without_alerts:
-        print(f"\n{Colors.CYAN}🔄 Processing: {subscription['name']}{Colors.RESET}")
-        
-        # Final check before creating alert
-        if not is_subscription_active(subscription['id']):
-            print(f"{Colors.RED}  ❌ Subscription became inactive, skipping{Colors.RESET}")
+    for subscription, status_code, error in _put_alerts(subscriptions_without_alerts, alert_name, emails):
+        if error is not None:
+            result_line = _ERR + "Exception creating alert: " + error + _RST
             failed_creates += 1
-            continue
-        
-        # Use the existing function to create the alert
-        access_token = get_access_token()
-        url = f"https://management.azure.com/subscriptions/{subscription['id']}/providers/Microsoft.CostManagement/scheduledActions/{alert_name}?api-version=2022-10-01"
-        
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json"
-        }
-        
-        # Set dates
-        start_date = datetime.now(timezone.utc).replace(microsecond=0)
-        end_date = (start_date + timedelta(days=1825)).replace(microsecond=0)  # 5 years = 365 * 5 = 1825 days
-        
-        alert_body = {
-            "kind": "InsightAlert",
-            "properties": {
-                "displayName": "Daily anomaly by resource",
-                "notification": {
-                    "to": emails,
-                    "subject": "Cost anomaly detected in the resource"
-                },
-                "schedule": {
-                    "frequency": "Daily",
-                    "startDate": start_date.isoformat(),
-                    "endDate": end_date.isoformat()
-                },
-                "status": "Enabled",
-                "viewId": f"/subscriptions/{subscription['id']}/providers/Microsoft.CostManagement/views/ms:DailyAnomalyByResourceGroup"
-            }
-        }
-
-        response = requests.put(url, headers=headers, data=json.dumps(alert_body))
-        
-        if response.status_code == 201 or response.status_code == 200:
-            print(f"{Colors.GREEN}  ✅ Alert successfully created{Colors.RESET}")
+        elif status_code == 201 or status_code == 200:
+            result_line = _OK + "Alert successfully created" + _RST
             successful_creates += 1
         else:
-            print(f"{Colors.RED}  ❌ Failed to create alert (Status: {response.status_code}){Colors.RESET}")
+            result_line = _ERR + "Failed to create alert (Status: " + str(status_code) + ")" + _RST
             failed_creates += 1
+        
+        sys.stdout.write(_PROCESSING + subscription['name'] + _RST + "\n" + result_line + "\n")
+        sys.stdout.flush()
     
     print(f"""
 {Colors.CYAN}🎉 FINAL RESULTS:{Colors.RESET}
@@ -664,49 +873,44 @@ def check_existing_alerts():
         return
     
     print_section_header("CHECKING EXISTING ALERTS (ACTIVE SUBSCRIPTIONS ONLY)")
-    access_token = get_access_token()
-    current_date = datetime.now(timezone.utc)
+    current_ts = time.time()
+    # Local names for the colors used in every row below
+    RED, GREEN, YELLOW, CYAN, RESET = Colors.RED, Colors.GREEN, Colors.YELLOW, Colors.CYAN, Colors.RESET
     
-    for subscription in subscriptions:
-        # Double-check subscription status
-        if not is_subscription_active(subscription['id']):
-            print(f"\n{Colors.RED}❌ {subscription['name'][:60]} - INACTIVE, skipping{Colors.RESET}")
-            continue
-            
-        url = f"https://management.azure.com/subscriptions/{subscription['id']}/providers/Microsoft.CostManagement/scheduledActions?api-version=2022-10-01"
-        
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json"
-        }
-        
-        response = requests.get(url, headers=headers)
+    rows = _subscription_rows(subscriptions)
+    
+    try:
+        existing_alerts = _existing_insight_alerts([row[0] for row in rows])
+    except Exception as e:
+        print_error_box(f"Error fetching scheduled actions: {str(e)}")
+        return
+    
+    for subscription_id, name, state in rows:
+        status_code, anomaly_alerts = existing_alerts.get(subscription_id, (None, None))
         
-        if response.status_code == 200:
-            data = response.json()
-            anomaly_alerts = [alert for alert in data.get('value', []) if alert.get('kind') == 'InsightAlert']
-            
+        if status_code == 200:
             if anomaly_alerts:
-                print(f"\n{Colors.CYAN}📋 {subscription['name'][:60]} ({subscription['state']}){Colors.RESET}")
+                print(f"\n{CYAN}📋 {name:.60} ({state}){RESET}")
                 for alert in anomaly_alerts:
+                    props = alert.get('properties') or {}
                     alert_name = alert.get('name', 'Unknown')
-                    end_date_str = alert.get('properties', {}).get('schedule', {}).get('endDate')
-                    status = alert.get('properties', {}).get('status', 'Unknown')
+                    end_date_str = (props.get('schedule') or {}).get('endDate')
+                    status = props.get('status', 'Unknown')
                     
                     if end_date_str:
-                        end_date = datetime.fromisoformat(end_date_str.replace('Z', '+00:00'))
-                        days_remaining = (end_date - current_date).days
+                        # Whole days left, floored like timedelta.days
+                        days_remaining = int((_end_date_timestamp(end_date_str) - current_ts) // 86400)
                         
                         if days_remaining > 0:
-                            print(f"{Colors.GREEN}    ✅ {alert_name} | Status: {status} | Remaining: {days_remaining} days{Colors.RESET}")
+                            print(f"{GREEN}    ✅ {alert_name} | Status: {status} | Remaining: {days_remaining} days{RESET}")
                         else:
-                            print(f"{Colors.RED}    ❌ {alert_name} | Status: {status} | Expired {abs(days_remaining)} days ago{Colors.RESET}")
+                            print(f"{RED}    ❌ {alert_name} | Status: {status} | Expired {abs(days_remaining)} days ago{RESET}")
                     else:
-                        print(f"{Colors.YELLOW}    ⚠️  {alert_name} | Status: {status} | No end date{Colors.RESET}")
+                        print(f"{YELLOW}    ⚠️  {alert_name} | Status: {status} | No end date{RESET}")
             else:
-                print(f"\n{Colors.RED}❌ {subscription['name'][:60]} ({subscription['state']}) - No Cost Anomaly alerts{Colors.RESET}")
+                print(f"\n{RED}❌ {name:.60} ({state}) - No Cost Anomaly alerts{RESET}")
         else:
-            print(f"\n{Colors.RED}❌ Error checking {subscription['name'][:60]}: {response.status_code}{Colors.RESET}")
+            print(f"\n{RED}❌ Error checking {name:.60}: {status_code}{RESET}")
 
 # Function to display subscriptions with expired alerts (updated)
 def display_subscriptions_with_expired_alerts():
@@ -720,49 +924,37 @@ def display_subscriptions_with_expired_alerts():
     print_section_header("SUBSCRIPTIONS WITH EXPIRED ALERTS (ACTIVE ONLY)")
     print(f"{Colors.CYAN}🔍 Checking {len(subscriptions)} active subscriptions for expired alerts...\n{Colors.RESET}")
     
-    access_token = get_access_token()
-    current_date = datetime.now(timezone.utc)
+    # An alert counts as expired once less than a full day remains
+    cutoff_ts = time.time() + 86400
     expired_subscriptions = []
     expired_count = 0
     
-    for i, subscription in enumerate(subscriptions, 1):
-        # Double-check subscription status
-        if not is_subscription_active(subscription['id']):
-            print(f"{Colors.RED}❌ {subscription['name'][:60]} - Subscription is not active, skipping{Colors.RESET}")
-            continue
-            
-        url = f"https://management.azure.com/subscriptions/{subscription['id']}/providers/Microsoft.CostManagement/scheduledActions?api-version=2022-10-01"
-        
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json"
-        }
-        
-        response = requests.get(url, headers=headers)
+    rows = _subscription_rows(subscriptions)
+    parts = []
+    
+    try:
+        existing_alerts = _existing_insight_alerts([row[0] for row in rows])
+    except Exception as e:
+        print_error_box(f"Error fetching scheduled actions: {str(e)}")
+        return
+    
+    for subscription_id, name, _ in rows:
+        status_code, anomaly_alerts = existing_alerts.get(subscription_id, (None, None))
         
-        if response.status_code == 200:
-            data = response.json()
-            anomaly_alerts = [alert for alert in data.get('value', []) if alert.get('kind') == 'InsightAlert']
-            
-            has_expired_alerts = False
-            for alert in anomaly_alerts:
-                end_date_str = alert.get('properties', {}).get('schedule', {}).get('endDate')
-                
-                if end_date_str:
-                    end_date = datetime.fromisoformat(end_date_str.replace('Z', '+00:00'))
-                    days_remaining = (end_date - current_date).days
-                    
-                    if days_remaining <= 0:
-                        has_expired_alerts = True
-                        break
+        if status_code == 200:
+            # Stop at the first expired alert
+            end_dates = (alert.get('properties', {}).get('schedule', {}).get('endDate') for alert in anomaly_alerts)
             
-            if has_expired_alerts:
+            if any(end_date_str and _end_date_timestamp(end_date_str) < cutoff_ts for end_date_str in end_dates):
                 expired_count += 1
-                print(f"{Colors.RED}❌ [{expired_count}] {subscription['name'][:60]} - EXPIRED ALERTS!{Colors.RESET}")
-                expired_subscriptions.append(subscription)
+                parts.append(_EXPIRED_ROW.format(count=expired_count, name=name))
+                expired_subscriptions.append(subscription_id)
         else:
             # Show errors but don't count as expired
-            print(f"{Colors.YELLOW}⚠️  {subscription['name'][:60]} - Error: {response.status_code}{Colors.RESET}")
+            parts.append(_ERROR_ROW.format(name=name, status=status_code))
+    
+    sys.stdout.write("".join(parts))
+    sys.stdout.flush()
     
     print(f"""
 {Colors.CYAN}📊 RESULTS:{Colors.RESET}
@@ -771,47 +963,43 @@ def display_subscriptions_with_expired_alerts():
 
 # Function to debug specific subscription alerts
 def debug_subscription_alerts(subscription_id):
-    access_token = get_access_token()
-    url = f"https://management.azure.com/subscriptions/{subscription_id}/providers/Microsoft.CostManagement/scheduledActions?api-version=2022-10-01"
-    
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Content-Type": "application/json"
-    }
+    url = _URL_TMPL % (subscription_id, subscription_id)
     
-    response = requests.get(url, headers=headers)
+    response = _arm_get(url)
     
     if response.status_code == 200:
-        data = response.json()
+        data = json.loads(response.content)
         anomaly_alerts = [alert for alert in data.get('value', []) if alert.get('kind') == 'InsightAlert']
         
         print(f"\n{Colors.CYAN}=== DEBUG ALERTS FOR SUBSCRIPTION {subscription_id} ==={Colors.RESET}")
         print(f"{Colors.WHITE}Found {len(anomaly_alerts)} anomaly alerts:{Colors.RESET}")
         
-        current_date = datetime.now(timezone.utc)
+        current_ts = time.time()
+        # Bind colors to locals once for the per-alert loop below
+        BLUE, GREEN, RED, YELLOW, RESET = Colors.BLUE, Colors.GREEN, Colors.RED, Colors.YELLOW, Colors.RESET
         
         for i, alert in enumerate(anomaly_alerts, 1):
+            # Look up properties and schedule once per alert
+            props = alert.get('properties') or {}
+            sched = props.get('schedule') or {}
             alert_name = alert.get('name', 'Unknown')
-            start_date_str = alert.get('properties', {}).get('schedule', {}).get('startDate')
-            end_date_str = alert.get('properties', {}).get('schedule', {}).get('endDate')
-            status = alert.get('properties', {}).get('status', 'Unknown')
+            start_date_str, end_date_str, status = sched.get('startDate'), sched.get('endDate'), props.get('status', 'Unknown')
             
-            print(f"\n{Colors.BLUE}Alert {i}:{Colors.RESET}")
+            print(f"\n{BLUE}Alert {i}:{RESET}")
             print(f"  Name: {alert_name}")
             print(f"  Status: {status}")
             print(f"  Start Date: {start_date_str}")
             print(f"  End Date: {end_date_str}")
             
             if end_date_str:
-                end_date = datetime.fromisoformat(end_date_str.replace('Z', '+00:00'))
-                days_remaining = (end_date - current_date).days
+                days_remaining = int((_end_date_timestamp(end_date_str) - current_ts) // 86400)
                 
                 if days_remaining > 0:
-                    print(f"  {Colors.GREEN}Days remaining: {days_remaining}{Colors.RESET}")
+                    print(f"  {GREEN}Days remaining: {days_remaining}{RESET}")
                 else:
-                    print(f"  {Colors.RED}Expired {abs(days_remaining)} days ago{Colors.RESET}")
+                    print(f"  {RED}Expired {abs(days_remaining)} days ago{RESET}")
             else:
-                print(f"  {Colors.YELLOW}No end date specified{Colors.RESET}")
+                print(f"  {YELLOW}No end date specified{RESET}")
     else:
         print(f"{Colors.RED}Error: {response.status_code}{Colors.RESET}")
 
@@ -827,7 +1015,7 @@ def display_menu():
 {Colors.WHITE}  3. 🎯 Create alerts for selected subscriptions{Colors.RESET}
 {Colors.WHITE}  4. 🔍 Check existing alerts{Colors.RESET}
 {Colors.WHITE}  5. ⚠️  Display subscriptions with expired alerts{Colors.RESET}
-{Colors.WHITE}  6. 🧹 Clear screen{Colors.RESET}
+{Colors.WHITE}  6. 🧹 Clear screen & refresh{Colors.RESET}
 {Colors.WHITE}  0. 🚪 Exit{Colors.RESET}
 
 {Colors.CYAN}{'='*50}{Colors.RESET}
@@ -835,7 +1023,11 @@ def display_menu():
 
 # Function to clear screen
 def clear_screen():
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if _LEGACY_CONSOLE:
+        os.system('cls')
+    else:
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
 
 # Function to parse command line arguments
 def parse_arguments():
@@ -872,6 +1064,67 @@ Examples:
     
     return parser.parse_args()
 
+# Run fn on a daemon thread with its output held back; on exit only requests already in flight are waited for
+def _submit_preload(fn, *args):
+    future = Future()
+    
+    def run():
+        _deferred_output.messages = messages = []
+        try:
+            value = fn(*args)
+        except Exception as e:
+            value = None
+            messages.append((f"{Colors.YELLOW}⚠️  Background refresh failed: {str(e)}{Colors.RESET}", None))
+        future.set_result((time.monotonic(), value, messages))
+    
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+# Existing alerts for the preloaded subscriptions (runs on the preload thread once the listing is done)
+def _preload_existing_alerts(subs_future):
+    _, subscriptions, _ = subs_future.result()
+    if not subscriptions:
+        return None
+    return fetch_insight_alerts([subscription['id'] for subscription in subscriptions])
+
+# Start (or restart) the background preload for the interactive menu
+def start_preload():
+    global _subs_future, _alerts_future
+    _subs_future = _submit_preload(_list_subscriptions)
+    _alerts_future = _submit_preload(_preload_existing_alerts, _subs_future)
+
+# Skip queued background work and cut short its retry waits (pool threads are joined at interpreter exit)
+def stop_preload():
+    _preload_cancel.set()
+
+# Wait for a preload, print what it held back, and return its value; None when absent, failed or stale
+def _preloaded_value(future):
+    if future is None:
+        return None
+    
+    loaded_at, value, messages = future.result()
+    while messages:
+        message, file = messages.pop(0)
+        print(message, file=file)
+    
+    if not value or time.monotonic() - loaded_at >= _SUBSCRIPTIONS_TTL:
+        return None
+    return value
+
+# Let the alert preload finish before a foreground fan-out, so the two never run their workers side by side
+def wait_for_preload():
+    if _alerts_future is not None and not _alerts_future.done():
+        print(f"{Colors.CYAN}⏳ Finishing background refresh...{Colors.RESET}")
+    _preloaded_value(_alerts_future)
+
+# Existing alerts from the preload when it is fresh and covers every subscription, else fetched now
+def _existing_insight_alerts(subscription_ids):
+    existing_alerts = _preloaded_value(_alerts_future)
+    if existing_alerts is not None and all(subscription_id in existing_alerts for subscription_id in subscription_ids):
+        return existing_alerts
+    
+    return fetch_insight_alerts(subscription_ids)
+
 # Main function with enhanced error handling
 def main():
     try:
@@ -909,7 +1162,8 @@ def main():
                 print_error_box("Auto mode completed with errors!")
                 sys.exit(1)
         
-        # Interactive mode
+        # Interactive mode: fetch in the background while the user reads the menu
+        start_preload()
         clear_screen()
         while True:
             display_menu()
@@ -923,32 +1177,42 @@ def main():
                 
             elif choice == "2":
                 clear_screen()
+                wait_for_preload()
                 create_alerts_for_all_subscriptions()
+                start_preload()
                 input(f"\n{Colors.CYAN}⏎ Press Enter to continue...{Colors.RESET}")
                 clear_screen()
                 
             elif choice == "3":
                 clear_screen()
+                wait_for_preload()
                 create_alert_for_selected_subscriptions()
+                start_preload()
                 input(f"\n{Colors.CYAN}⏎ Press Enter to continue...{Colors.RESET}")
                 clear_screen()
                 
             elif choice == "4":
                 clear_screen()
                 check_existing_alerts()
+                start_preload()
                 input(f"\n{Colors.CYAN}⏎ Press Enter to continue...{Colors.RESET}")
                 clear_screen()
                 
             elif choice == "5":
                 clear_screen()
                 display_subscriptions_with_expired_alerts()
+                start_preload()
                 input(f"\n{Colors.CYAN}⏎ Press Enter to continue...{Colors.RESET}")
                 clear_screen()
                 
             elif choice == "6":
+                # Also drop the cached subscriptions listing so the next action re-reads it
+                get_subscriptions.cache_clear()
                 clear_screen()
+                start_preload()
                 
             elif choice == "0":
+                stop_preload()
                 print(f"""
 {Colors.GREEN}👋 Thank you for using Azure Cost Anomaly Alert Manager!{Colors.RESET}
 {Colors.GREEN}🌟 Goodbye! 🌟{Colors.RESET}
@@ -961,6 +1225,7 @@ def main():
                 clear_screen()
     
     except KeyboardInterrupt:
+        stop_preload()
         print(f"\n{Colors.YELLOW}⚠️  Operation cancelled by user{Colors.RESET}")
         sys.exit(0)
     except Exception as e:
@@ -978,8 +1243,11 @@ def display_subscriptions():
     print_section_header("ACTIVE SUBSCRIPTIONS")
     print(f"{Colors.CYAN}Found {len(subscriptions)} active subscriptions:\n{Colors.RESET}")
     
-    for i, sub in enumerate(subscriptions, 1):
-        print(f"{Colors.GREEN}  {i:3d}. {sub['name'][:60]} ({sub['id']}) - {sub['state']}{Colors.RESET}")
+    sys.stdout.write("".join(
+        _ROW.format(i=i, name=name, sid=subscription_id, state=state)
+        for i, (subscription_id, name, state) in enumerate(_subscription_rows(subscriptions), 1)
+    ))
+    sys.stdout.flush()
 
 # Run main function
 if __name__ == "__main__":